@@ -0,0 +1,128 @@
+"""
+Async counterparts of the translation lookups, for Python 3.5+.
+
+Add ``AsyncTranslatableUtilsMixin`` to the bases of your translatable model
+to get ``atranslate()``, ``asafe_translate()`` and
+``auntranslated_languages()``. They share the ``_safe_translate_cache`` with
+their synchronous counterparts.
+
+If Django provides an async ORM it is used directly, otherwise every lookup
+runs its queries in one thread hop through ``asgiref.sync.sync_to_async``
+(``asgiref`` must be installed in that case). Checking the read-your-writes
+pinning (see ``django_t10e.routing``) uses the synchronous cache API, so it is
+never done on the event loop thread.
+"""
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.db.models.query import QuerySet
+from django.utils.translation import get_language
+
+from . import settings
+from .models import (
+    LANGUAGES, _get_missing_translations, _get_translations_queryset,
+    _store_translations, bulk_safe_translate)
+from .routing import using_lookup_db
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    sync_to_async = None
+
+
+HAS_ASYNC_ORM = hasattr(QuerySet, 'aget')
+
+
+def _run_sync(func, *args, **kwargs):
+    if sync_to_async is None:
+        raise ImproperlyConfigured(
+            'asgiref is required for the async API of django_t10e on Django '
+            'versions without async ORM support.')
+    return sync_to_async(func)(*args, **kwargs)
+
+
+async def _route(func, *args, **kwargs):
+    """
+    Call the routing function ``func``, off the event loop if it may need to
+    check the read-your-writes pinning in the cache.
+    """
+    if settings.T10E_READ_YOUR_WRITES_TIMEOUT:
+        return await _run_sync(func, *args, **kwargs)
+    return func(*args, **kwargs)
+
+
+async def _list(queryset):
+    # Only used with the async ORM. No async comprehension, to stay
+    # compatible with Python 3.5.
+    objs = []
+    async for obj in queryset:
+        objs.append(obj)
+    return objs
+
+
+class AsyncTranslatableUtilsMixin(object):
+    """
+    Async versions of the lookups in ``TranslatableUtilsMixin``.
+    """
+
+    async def atranslate(self, language=None):
+        # Resolve the language here, the thread running the query does not
+        # share the active translation.
+        if language is None:
+            language = get_language()
+        if language == self.language:
+            return self
+        if not HAS_ASYNC_ORM:
+            return await _run_sync(self.translate, language)
+        queryset = await _route(using_lookup_db, self.translations(), instance=self)
+        return await queryset.translate(language).aget()
+
+    async def asafe_translate(self, language=None):
+        if not hasattr(self, '_safe_translate_cache'):
+            self._safe_translate_cache = {}
+        if language is None:
+            language = get_language()
+        if language not in self._safe_translate_cache:
+            try:
+                self._safe_translate_cache[language] = await self.atranslate(language)
+            except ObjectDoesNotExist:
+                self._safe_translate_cache[language] = self
+        return self._safe_translate_cache[language]
+
+    async def auntranslated_languages(self):
+        if not HAS_ASYNC_ORM:
+            return await _run_sync(self.untranslated_languages)
+        queryset = await _route(using_lookup_db, self.translations(), instance=self)
+        translated_languages = set(await _list(queryset.values_list('language', flat=True)))
+        return [
+            language for language in LANGUAGES
+            if language[0] not in translated_languages]
+
+
+async def abulk_safe_translate(objects, language=None):
+    """
+    Async version of ``django_t10e.models.bulk_safe_translate()``. All objects are resolved
+    natively with the async ORM or in one thread hop, without blocking the
+    event loop.
+    """
+    if language is None:
+        language = get_language()
+    objects = list(objects)
+    if not HAS_ASYNC_ORM:
+        return await _run_sync(bulk_safe_translate, objects, language)
+    for model, model_objects in _get_missing_translations(objects, language).items():
+        queryset = await _route(_get_translations_queryset, model, model_objects, language)
+        translations = await _list(queryset)
+        _store_translations(model_objects, translations, language)
+    return [obj._safe_translate_cache[language] for obj in objects]
+
+
+async def arelated_translations(instance, field_name):
+    """
+    Async accessor for the ``%s_translations`` manager that a
+    ``TranslatableForeignKey`` named ``field_name`` adds to ``instance``.
+    Returns the list of all translations of the related object.
+    """
+    field = instance._meta.get_field(field_name)
+    manager = getattr(instance, field._get_translations_name())
+    if not HAS_ASYNC_ORM:
+        return await _run_sync(lambda: list(manager.all()))
+    return await _list(await _route(manager.all))
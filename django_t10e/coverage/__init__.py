@@ -0,0 +1,15 @@
+"""
+Optional per-language translation coverage statistics.
+
+Add ``'django_t10e.coverage'`` to ``INSTALLED_APPS`` to keep the number of
+translations per model, language and translation status in a small summary
+table. Use ``TranslationCoverage.objects.get_coverage(Model)`` to read them
+and the ``rebuild_translation_coverage`` command to (re)build them.
+
+The statistics are updated from the previous state of each saved row, read
+under a row lock. Changes that bypass ``save()`` and the bulk operations of
+django_t10e (e.g. ``QuerySet.update()``, raw SQL or deleting stale objects)
+are not tracked and let the statistics drift. Run
+``rebuild_translation_coverage`` to repair them.
+"""
+default_app_config = 'django_t10e.coverage.apps.CoverageConfig'
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete
+
+
+class CoverageConfig(AppConfig):
+    name = 'django_t10e.coverage'
+    label = 't10e_coverage'
+    verbose_name = 'Translation coverage'
+
+    def ready(self):
+        from .tracking import record_delete_handler
+        post_delete.connect(record_delete_handler, dispatch_uid='django_t10e.coverage.record_delete')
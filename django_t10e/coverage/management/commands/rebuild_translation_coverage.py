@@ -0,0 +1,38 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.encoding import force_text
+
+from ...models import TranslationCoverage
+from ...tracking import is_translatable, count_translations
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the translation coverage statistics for all translatable "
+        "models. Give <app.model> as argument to only rebuild a particular "
+        "model.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='*', metavar='app.model')
+        parser.add_argument(
+            '--batch-size', dest='batch_size', type=int, default=10000,
+            help="Number of rows to read per query.")
+
+    def handle(self, *args, **options):
+        if options['models']:
+            try:
+                Models = [apps.get_model(label) for label in options['models']]
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+        else:
+            Models = [
+                Model for Model in apps.get_models()
+                if is_translatable(Model) and not Model._meta.proxy]
+        for Model in Models:
+            if not is_translatable(Model):
+                raise CommandError("{0}.{1} is not translatable.".format(
+                    Model._meta.app_label, Model._meta.object_name))
+            self.stdout.write("Rebuilding {0} ...".format(
+                force_text(Model._meta.verbose_name)))
+            counts = count_translations(Model, batch_size=options['batch_size'])
+            TranslationCoverage.objects.replace_counts(Model, counts)
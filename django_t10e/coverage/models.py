@@ -0,0 +1,119 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import F
+from django.utils import six
+from django.utils.encoding import python_2_unicode_compatible
+
+
+class TranslationCoverageManager(models.Manager):
+    def get_coverage(self, model):
+        """
+        Return the translation coverage of ``model``::
+
+            {
+                'total': 42,  # number of translation sets
+                'languages': {
+                    'de': {'count': 40, 'missing': 2, 'statuses': {'done': 38, 'todo': 2}},
+                    ...
+                },
+            }
+
+        Reads only the summary rows of ``model``, no matter how many objects
+        it has.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        rows = self.filter(content_type=content_type).values_list(
+            'language', 'translation_status', 'count')
+        total = 0
+        languages = dict(
+            (code, {'count': 0, 'statuses': {}})
+            for code, name in settings.LANGUAGES)
+        for language, translation_status, count in rows:
+            # Rows are not deleted when their count drops to zero, skip them
+            # like ``replace_counts()`` does.
+            if not count:
+                continue
+            if not language:
+                total += count
+                continue
+            coverage = languages.setdefault(language, {'count': 0, 'statuses': {}})
+            coverage['count'] += count
+            if translation_status:
+                coverage['statuses'][translation_status] = count
+        for coverage in languages.values():
+            coverage['missing'] = max(total - coverage['count'], 0)
+        return {
+            'total': total,
+            'languages': languages,
+        }
+
+    def apply_deltas(self, model, deltas):
+        """
+        Add the counts in ``deltas``, a dict mapping
+        ``(language, translation_status)`` to the count difference, to the
+        statistics of ``model``. The rows are updated in sorted order, so
+        concurrent updates can not deadlock each other.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        db = router.db_for_write(self.model)
+        for (language, translation_status), delta in sorted(six.iteritems(deltas)):
+            if not delta:
+                continue
+            lookup = {
+                'content_type': content_type,
+                'language': language,
+                'translation_status': translation_status,
+            }
+            queryset = self.using(db).filter(**lookup)
+            if queryset.update(count=F('count') + delta):
+                continue
+            try:
+                with transaction.atomic(using=db):
+                    self.using(db).create(count=delta, **lookup)
+            except IntegrityError:
+                # Somebody else created the row in the meantime.
+                queryset.update(count=F('count') + delta)
+
+    def replace_counts(self, model, counts):
+        """
+        Replace all statistics of ``model`` with ``counts`` (same format as
+        the ``deltas`` of ``apply_deltas()``).
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        db = router.db_for_write(self.model)
+        with transaction.atomic(using=db):
+            self.using(db).filter(content_type=content_type).delete()
+            self.using(db).bulk_create([
+                self.model(
+                    content_type=content_type,
+                    language=language,
+                    translation_status=translation_status,
+                    count=count)
+                for (language, translation_status), count in six.iteritems(counts)
+                if count])
+
+
+@python_2_unicode_compatible
+class TranslationCoverage(models.Model):
+    """
+    Number of translations of one model in one language and translation
+    status. The row with an empty ``language`` holds the number of
+    translation sets.
+    """
+
+    content_type = models.ForeignKey(ContentType)
+    language = models.CharField(max_length=10, blank=True)
+    translation_status = models.CharField(max_length=50, blank=True)
+    count = models.IntegerField(default=0)
+
+    objects = TranslationCoverageManager()
+
+    class Meta:
+        unique_together = (
+            ('content_type', 'language', 'translation_status'),
+        )
+
+    def __str__(self):
+        return '{0} {1} {2}: {3}'.format(
+            self.content_type, self.language, self.translation_status, self.count)
@@ -0,0 +1,226 @@
+"""
+Incremental maintenance of the coverage statistics. These functions are
+called by the translatable models themselves and are no-ops unless
+``django_t10e.coverage`` is installed.
+"""
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.encoding import force_text
+
+from ..routing import db_for_sync
+
+
+_enabled = None
+_local = threading.local()
+
+
+def is_enabled():
+    # Called for every saved translatable object, so only look at the app
+    # registry once it is ready.
+    global _enabled
+    if _enabled is None:
+        if not apps.ready:
+            return apps.is_installed('django_t10e.coverage')
+        _enabled = apps.is_installed('django_t10e.coverage')
+    return _enabled
+
+
+@receiver(setting_changed)
+def _reset_enabled(setting, **kwargs):
+    global _enabled
+    if setting == 'INSTALLED_APPS':
+        _enabled = None
+
+
+def _get_manager():
+    from .models import TranslationCoverage
+    return TranslationCoverage.objects
+
+
+def is_translatable(model):
+    from ..models import TranslatableBaseMixin
+    return issubclass(model, TranslatableBaseMixin)
+
+
+def _has_translation_status(model):
+    return (
+        hasattr(model, '_has_translation_status_field') and
+        model._has_translation_status_field())
+
+
+def get_state(instance):
+    """
+    Return the statistic keys that ``instance`` counts towards.
+    """
+    status = None
+    if _has_translation_status(instance.__class__):
+        status = instance.translation_status
+    keys = [(instance.language, '' if status is None else force_text(status))]
+    if instance.pk is not None and instance.translation_set_id == instance.pk:
+        # Base translations also count as one translation set.
+        keys.append(('', ''))
+    return tuple(keys)
+
+
+def get_states(objs):
+    """
+    Return a dict mapping the pks of ``objs`` to the statistic keys they
+    currently count towards. Use it for objects that were loaded under a row
+    lock, before changing them.
+    """
+    if not is_enabled():
+        return {}
+    return dict((obj.pk, get_state(obj)) for obj in objs)
+
+
+def get_previous_states(model, pks, using=None):
+    """
+    Return a dict mapping ``pks`` to the statistic keys of the rows as they
+    are stored in the database. The rows are locked with ``SELECT ... FOR
+    UPDATE``, so this must be called inside a transaction; concurrent writers
+    then can not change the rows before the new state is recorded.
+    """
+    if not is_enabled():
+        return {}
+    db = using or db_for_sync(model)
+    fields = ['pk', 'language', 'translation_set_id']
+    has_translation_status = _has_translation_status(model)
+    if has_translation_status:
+        fields.append('translation_status')
+    rows = (
+        model._default_manager.using(db)
+        .filter(pk__in=pks)
+        .order_by('pk')
+        .select_for_update()
+        .values_list(*fields))
+    states = {}
+    for row in rows:
+        pk, language, translation_set_id = row[:3]
+        status = row[3] if has_translation_status else None
+        keys = [(language, '' if status is None else force_text(status))]
+        if pk == translation_set_id:
+            keys.append(('', ''))
+        states[pk] = tuple(keys)
+    return states
+
+
+def get_previous_state(instance, using=None):
+    """
+    Return the state of ``instance`` as stored in the database, see
+    ``get_previous_states()``. Must be called before saving it.
+    """
+    # Clones (see ``prepare_translation``) are copies of saved objects, so
+    # their ``_state`` says they are not added, but they have no pk yet.
+    if not is_enabled() or instance._state.adding or instance.pk is None:
+        return ()
+    states = get_previous_states(instance.__class__, [instance.pk], using=using)
+    return states.get(instance.pk, ())
+
+
+def _get_deltas(old_state, new_state):
+    deltas = Counter(new_state)
+    deltas.subtract(Counter(old_state))
+    return deltas
+
+
+@contextmanager
+def collect_deltas():
+    """
+    Collect all statistic changes inside the block and apply them once, in a
+    fixed order, when the outermost block is left. Use it around code that
+    saves many translations in one transaction, so the few shared statistic
+    rows are locked only at the end and always in the same order.
+    """
+    if getattr(_local, 'pending', None) is not None:
+        yield
+        return
+    _local.pending = {}
+    try:
+        yield
+        pending = _local.pending
+    finally:
+        _local.pending = None
+    _apply_deltas(pending)
+
+
+def _add_deltas(model, deltas):
+    # Proxy models share the statistics (and the place in the locking order)
+    # of their concrete model.
+    model = model._meta.concrete_model
+    pending = getattr(_local, 'pending', None)
+    if pending is None:
+        _apply_deltas({model: deltas})
+    else:
+        pending.setdefault(model, Counter()).update(deltas)
+
+
+def _apply_deltas(pending):
+    def model_key(model):
+        return (model._meta.app_label, model._meta.model_name)
+    for model in sorted(pending, key=model_key):
+        _get_manager().apply_deltas(model, pending[model])
+
+
+def record_save(instance, previous_state):
+    if not is_enabled():
+        return
+    _add_deltas(instance.__class__, _get_deltas(previous_state, get_state(instance)))
+
+
+def record_bulk(model, objs, previous_states=None):
+    """
+    Record the changes of objects that were written with ``bulk_create`` or
+    a bulk update, i.e. without calling ``save()``. ``previous_states`` maps
+    the pks of updated objects to their state before the update (see
+    ``get_previous_states()`` and ``get_states()``), leave it out for created
+    objects.
+    """
+    if not is_enabled():
+        return
+    if previous_states is None:
+        previous_states = {}
+    deltas = Counter()
+    for obj in objs:
+        deltas.update(_get_deltas(previous_states.get(obj.pk, ()), get_state(obj)))
+    _add_deltas(model, deltas)
+
+
+def record_delete_handler(sender, instance, **kwargs):
+    if not is_translatable(sender):
+        return
+    deltas = Counter()
+    deltas.subtract(Counter(get_state(instance)))
+    _add_deltas(sender, deltas)
+
+
+def count_translations(model, batch_size=10000):
+    """
+    Count all translations of ``model`` from scratch, reading ``batch_size``
+    rows at a time.
+    """
+    fields = ['pk', 'language', 'translation_set_id']
+    has_translation_status = _has_translation_status(model)
+    if has_translation_status:
+        fields.append('translation_status')
+    counts = Counter()
+    last_pk = None
+    while True:
+        queryset = model._default_manager.order_by('pk')
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        rows = list(queryset.values_list(*fields)[:batch_size])
+        if not rows:
+            break
+        for row in rows:
+            pk, language, translation_set_id = row[:3]
+            status = row[3] if has_translation_status else None
+            counts[(language, '' if status is None else force_text(status))] += 1
+            if pk == translation_set_id:
+                counts[('', '')] += 1
+        last_pk = rows[-1][0]
+    return counts
@@ -1,10 +1,11 @@
 from django.db import models
 from . import settings
 from django.db.models.fields.related import ReverseSingleRelatedObjectDescriptor
-from django.db import connections, router
+from django.db import connections
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from jsonfield import JSONField
+from .routing import db_for_lookup
 
 
 class LanguageField(models.CharField):
@@ -65,7 +66,9 @@ class TranslatableForeignRelatedObjectsDescriptor(object):
                 try:
                     return self.instance._prefetched_objects_cache[rel_field.related_query_name()]
                 except (AttributeError, KeyError):
-                    db = self._db or router.db_for_read(self.model, instance=self.instance)
+                    db = self._db or db_for_lookup(
+                        self.model, instance=self.instance,
+                        translation_set_id=getattr(self.instance, obj_field.attname))
                     qs = super(TranslatableRelatedManager, self).get_queryset().using(db).filter(**self.core_filters)
                     empty_strings_as_null = connections[db].features.interprets_empty_strings_as_nulls
                     for field in rel_field.foreign_related_fields:
@@ -1,5 +1,12 @@
 import json
+from collections import OrderedDict
 import floppyforms.__future__ as forms
+from django.db import transaction
+
+from . import settings
+from .coverage import tracking as coverage
+from .routing import db_for_sync, pin_translation_set
+from .utils import bulk_update
 
 
 class HiddenSyncedI18nFieldsWidget(forms.HiddenInput):
@@ -46,15 +53,21 @@ class SyncedI18NFieldsFormMixin(object):
         """
         return {}
 
+    def _get_synced_i18n_model_to_form_fields(self):
+        # The map is static per form, so only build it once.
+        if not hasattr(self, '_synced_i18n_model_to_form_fields'):
+            self._synced_i18n_model_to_form_fields = self.get_synced_i18n_model_to_form_fields()
+        return self._synced_i18n_model_to_form_fields
+
     def map_synced_i18n_model_to_form_fields(self, fields):
-        field_map = self.get_synced_i18n_model_to_form_fields()
+        field_map = self._get_synced_i18n_model_to_form_fields()
         return [
             field_map.get(field) or field
             for field in fields
             if not (field in field_map and field_map[field] is None)]
 
     def map_synced_i18n_form_to_model_fields(self, fields):
-        field_map = self.get_synced_i18n_model_to_form_fields()
+        field_map = self._get_synced_i18n_model_to_form_fields()
         # reverse field map
         field_map = dict(
             (value, key)
@@ -79,3 +92,133 @@ class SyncedI18NFieldsFormMixin(object):
     def get_unsynced_i18n_fields(self):
         return self.map_synced_i18n_model_to_form_fields(
             self.get_unsynced_i18n_model_fields())
+
+
+class TranslationSetFormGroup(object):
+    """
+    Edit all translations of one translation set at once, with one
+    ``form_class`` instance per language::
+
+        forms = TranslationSetFormGroup(ArticleForm, article, data=request.POST)
+        if forms.is_valid():
+            forms.save()
+
+    All translations are loaded from the write database with one query. Only
+    the translations in ``languages`` (defaults to ``T10E_LANGUAGE_CHOICES``)
+    get a form, the form for ``instance`` is always included. On save the form
+    of ``instance`` is saved as usual, the changed fields of all other
+    translations are written with one bulk update per set of changed fields
+    and ``update_translations()`` is called once at the end to sync the
+    non-language specific fields from ``instance`` to all translations.
+    """
+
+    def __init__(self, form_class, instance, data=None, files=None, languages=None, **form_kwargs):
+        self.form_class = form_class
+        self.instance = instance
+        db = db_for_sync(instance.__class__, instance=instance)
+        translations = dict(
+            (translation.language, translation)
+            for translation in instance.translations().using(db))
+        translations[instance.language] = instance
+        if languages is None:
+            languages = [code for code, name in settings.T10E_LANGUAGE_CHOICES]
+        languages = list(languages)
+        # The source translation is always edited, its form is saved first.
+        if instance.language not in languages:
+            languages.insert(0, instance.language)
+        self.forms = OrderedDict()
+        for language in languages:
+            if language not in translations:
+                continue
+            self.forms[language] = self.get_form(
+                translations[language], data=data, files=files, **form_kwargs)
+
+    def get_form(self, translation, **kwargs):
+        kwargs.setdefault('prefix', translation.language)
+        return self.form_class(instance=translation, **kwargs)
+
+    def __iter__(self):
+        return iter(self.forms.values())
+
+    def __getitem__(self, language):
+        return self.forms[language]
+
+    def __len__(self):
+        return len(self.forms)
+
+    @property
+    def source_form(self):
+        return self.forms[self.instance.language]
+
+    @property
+    def errors(self):
+        return dict(
+            (language, form.errors)
+            for language, form in self.forms.items()
+            if form.errors)
+
+    def is_valid(self):
+        # Validate all forms, so every form has its errors populated.
+        return all([form.is_valid() for form in self])
+
+    def get_bulk_update_fields(self, form):
+        """
+        Return the names of the model fields that shall be written for the
+        (not-source) ``form``. Fields that are synced from the source
+        translation are skipped, ``update_translations()`` takes care of them.
+        """
+        opts = form.instance._meta
+        concrete_fields = set(
+            field.name for field in opts.concrete_fields
+            if not field.primary_key)
+        synced_fields = set(self.instance.get_to_be_synced_i18n_fields())
+        return (concrete_fields & set(form.changed_data)) - synced_fields
+
+    @transaction.atomic
+    def save(self):
+        """
+        Save all forms. The translation set is locked first (in primary key
+        order, see ``lock_translation_set``), so concurrent saves of the same
+        set can not deadlock. This always waits for the lock: the submitted
+        contents have to be saved, so deferring is no option here.
+        """
+        self.instance.lock_translation_set()
+        with coverage.collect_deltas():
+            return self._save()
+
+    def _save(self):
+        source = self.source_form.save()
+        has_translation_status = source._has_translation_status_field()
+        # Only write the fields that changed in the form of a translation,
+        # writing the fields of other forms would overwrite concurrent edits.
+        translations_by_fields = OrderedDict()
+        changed_forms = [
+            form for form in self
+            if form is not self.source_form and form.has_changed()]
+        for form in changed_forms:
+            translation = form.save(commit=False)
+            update_fields = set(self.get_bulk_update_fields(form))
+            if has_translation_status:
+                # Write the current status right away, so that
+                # ``update_translations()`` does not need to save the
+                # translation again.
+                translation.update_translation_status()
+                update_fields.add('translation_status')
+            translations_by_fields.setdefault(frozenset(update_fields), []).append(translation)
+        to_write = [
+            translation
+            for update_fields, translations in translations_by_fields.items()
+            if update_fields
+            for translation in translations]
+        if to_write:
+            previous_coverage_states = coverage.get_previous_states(
+                source.__class__, [translation.pk for translation in to_write])
+            for update_fields, translations in translations_by_fields.items():
+                if update_fields:
+                    bulk_update(translations, update_fields)
+            coverage.record_bulk(source.__class__, to_write, previous_coverage_states)
+            pin_translation_set(source.__class__, source.translation_set_id)
+        for form in changed_forms:
+            form.save_m2m()
+        source.update_translations(nowait=False)
+        return [form.instance for form in self]
@@ -0,0 +1,296 @@
+"""
+Streaming export and import of translation contents, e.g. for exchanging
+translations with translation vendors.
+
+The exchange format is JSONL, one translation set per line::
+
+    {"model": "news.article", "translation_set": 13, "language": "en",
+     "fields": {"title": "I18N is hard", ...},
+     "translations": {"de": {"pk": 14, "fields": {"title": "...", ...}}}}
+
+``fields`` always holds the contents of the base translation, the
+``translations`` hold the contents of all other existing translations. Only
+the fields returned by ``get_contents_fields()`` are exchanged. Optionally all
+translations into one target language can be exported as XLIFF 1.2 instead.
+"""
+import itertools
+import json
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import router, transaction
+from django.db.models import F, Q
+from django.utils import six
+from django.utils.encoding import force_text
+
+from . import settings
+from .coverage import tracking as coverage
+from .routing import pin_translation_sets
+from .utils import bulk_update
+
+
+XLIFF_NAMESPACE = 'urn:oasis:names:tc:xliff:document:1.2'
+
+
+def _model_label(model):
+    return '{0}.{1}'.format(model._meta.app_label, model._meta.model_name)
+
+
+def _get_contents(instance):
+    opts = instance._meta
+    return dict(
+        (field_name, opts.get_field(field_name).value_from_object(instance))
+        for field_name in instance.get_contents_fields())
+
+
+def iter_translation_sets(queryset, languages=None, chunk_size=1000):
+    """
+    Yield one record (see module docstring) per translation set whose base
+    translation is part of ``queryset``. Only translations in ``languages``
+    are included if given.
+
+    The translation sets are paged through by primary key, ``chunk_size``
+    sets at a time, so memory usage does not grow with the size of the
+    queryset (database drivers load whole result sets, even for
+    ``iterator()``).
+    """
+    model = queryset.model
+    label = _model_label(model)
+    parents = queryset.filter(translation_set__pk=F('pk')).order_by('pk')
+    last_pk = None
+    while True:
+        page = parents
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        parent_ids = list(page.values_list('pk', flat=True)[:chunk_size])
+        if not parent_ids:
+            break
+        last_pk = parent_ids[-1]
+        translations = (
+            model._default_manager.using(queryset.db)
+            .filter(translation_set__in=parent_ids))
+        if languages is not None:
+            translations = translations.filter(
+                Q(pk=F('translation_set')) | Q(language__in=languages))
+        grouped = itertools.groupby(
+            translations.order_by('translation_set', 'pk').iterator(),
+            key=lambda obj: obj.translation_set_id)
+        for translation_set_id, objs in grouped:
+            record = {
+                'model': label,
+                'translation_set': translation_set_id,
+                'translations': {},
+            }
+            for obj in objs:
+                if obj.pk == translation_set_id:
+                    record['language'] = obj.language
+                    record['fields'] = _get_contents(obj)
+                else:
+                    record['translations'][obj.language] = {
+                        'pk': obj.pk,
+                        'fields': _get_contents(obj),
+                    }
+            yield record
+
+
+def export_translations(queryset, stream, languages=None):
+    """
+    Write all translation sets of ``queryset`` as JSONL to ``stream``.
+    Returns the number of exported translation sets.
+    """
+    count = 0
+    for record in iter_translation_sets(queryset, languages=languages):
+        stream.write(force_text(json.dumps(
+            record, cls=DjangoJSONEncoder, ensure_ascii=False, sort_keys=True)) + u'\n')
+        count += 1
+    return count
+
+
+def export_translations_xliff(queryset, stream, target_language):
+    """
+    Write all translation sets of ``queryset`` as XLIFF 1.2 to ``stream``.
+    The base translation is used as source, the translation into
+    ``target_language`` (if any) as target. One ``<file>`` is written per
+    language of the base translations. Returns the number of exported
+    translation sets.
+    """
+    model = queryset.model
+    parents = queryset.filter(translation_set__pk=F('pk'))
+    source_languages = parents.order_by('language').values_list('language', flat=True).distinct()
+    stream.write(u'<?xml version="1.0" encoding="UTF-8"?>\n')
+    stream.write(u'<xliff version="1.2" xmlns="{0}">\n'.format(XLIFF_NAMESPACE))
+    count = 0
+    for source_language in list(source_languages):
+        if source_language == target_language:
+            continue
+        stream.write(
+            u'<file original={0} source-language={1} target-language={2} datatype="plaintext">\n'.format(
+                quoteattr(_model_label(model)), quoteattr(source_language), quoteattr(target_language)))
+        stream.write(u'<body>\n')
+        records = iter_translation_sets(
+            parents.filter(language=source_language), languages=[target_language])
+        for record in records:
+            _write_xliff_group(stream, record, target_language)
+            count += 1
+        stream.write(u'</body>\n</file>\n')
+    stream.write(u'</xliff>\n')
+    return count
+
+
+def _write_xliff_group(stream, record, target_language):
+    target = record['translations'].get(target_language, {}).get('fields', {})
+    stream.write(u'<group resname={0}>\n'.format(
+        quoteattr(force_text(record['translation_set']))))
+    for field_name, source_value in sorted(record['fields'].items()):
+        if source_value is None:
+            continue
+        unit = u'<trans-unit id={0} resname={1}><source>{2}</source>'.format(
+            quoteattr(u'{0}:{1}'.format(record['translation_set'], field_name)),
+            quoteattr(field_name),
+            escape(force_text(source_value)))
+        if target.get(field_name) is not None:
+            unit += u'<target>{0}</target>'.format(escape(force_text(target[field_name])))
+        stream.write(unit + u'</trans-unit>\n')
+    stream.write(u'</group>\n')
+
+
+def read_jsonl(stream):
+    """
+    Yield the records of a JSONL export, one line at a time.
+    """
+    for line in stream:
+        line = force_text(line).strip()
+        if line:
+            yield json.loads(line)
+
+
+def read_xliff(stream):
+    """
+    Yield records from an XLIFF file as written by
+    ``export_translations_xliff()``. Only ``<target>`` values are returned.
+    The file is parsed incrementally.
+    """
+    ns = '{%s}' % XLIFF_NAMESPACE
+    target_language = None
+    for event, elem in ElementTree.iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == ns + 'file':
+                target_language = elem.get('target-language')
+            continue
+        if elem.tag != ns + 'group':
+            continue
+        fields = {}
+        for unit in elem.iter(ns + 'trans-unit'):
+            target = unit.find(ns + 'target')
+            if target is not None:
+                fields[unit.get('resname')] = target.text or u''
+        if fields:
+            yield {
+                'translation_set': int(elem.get('resname')),
+                'translations': {target_language: {'fields': fields}},
+            }
+        elem.clear()
+
+
+def import_translations(model, records, batch_size=500, using=None):
+    """
+    Create or update translations of ``model`` from ``records`` (see
+    ``read_jsonl()`` and ``read_xliff()``).
+
+    Translations are processed in batches of ``batch_size``: existing
+    translations are written back with one bulk update, missing translations
+    are prepared from the base translation and created with ``bulk_create``.
+    ``save()`` is not called, but the translation status is recomputed for all
+    touched translations if the model has a ``translation_status`` field.
+
+    Many to many relations of newly created translations are not cloned, call
+    ``update_translations()`` on the base translation if you rely on them.
+
+    Translations into languages that are not part of
+    ``T10E_LANGUAGE_CHOICES`` and translations of unknown translation sets
+    are skipped.
+
+    Returns a dict with the number of ``created``, ``updated`` and
+    ``skipped`` translations.
+    """
+    db = using or router.db_for_write(model)
+    stats = {'created': 0, 'updated': 0, 'skipped': 0}
+    known_languages = set(code for code, name in settings.T10E_LANGUAGE_CHOICES)
+    batch = []
+    for record in records:
+        for language, translation in six.iteritems(record['translations']):
+            if language not in known_languages:
+                stats['skipped'] += 1
+                continue
+            batch.append((record['translation_set'], language, translation['fields']))
+        if len(batch) >= batch_size:
+            _import_batch(model, batch, db, stats)
+            batch = []
+    if batch:
+        _import_batch(model, batch, db, stats)
+    return stats
+
+
+def _set_contents(instance, fields):
+    opts = instance._meta
+    contents_fields = set(instance.get_contents_fields())
+    for field_name, value in six.iteritems(fields):
+        if field_name not in contents_fields:
+            continue
+        field = opts.get_field(field_name)
+        setattr(instance, field.attname, field.to_python(value))
+    return contents_fields.intersection(fields)
+
+
+def _import_batch(model, batch, db, stats):
+    has_translation_status = (
+        hasattr(model, '_has_translation_status_field') and
+        model._has_translation_status_field())
+    with transaction.atomic(using=db), coverage.collect_deltas():
+        translation_set_ids = set(translation_set_id for translation_set_id, language, fields in batch)
+        existing = {}
+        parents = {}
+        # Lock the existing translations, so the coverage statistics can be
+        # updated from their current state.
+        queryset = (
+            model._default_manager.using(db)
+            .filter(translation_set__in=translation_set_ids)
+            .order_by('pk')
+            .select_for_update())
+        for obj in queryset:
+            existing[(obj.translation_set_id, obj.language)] = obj
+            if obj.pk == obj.translation_set_id:
+                parents[obj.pk] = obj
+        previous_coverage_states = coverage.get_states(existing.values())
+        to_update = {}
+        to_create = {}
+        update_fields = set()
+        for translation_set_id, language, fields in batch:
+            key = (translation_set_id, language)
+            if key in existing:
+                obj = existing[key]
+                to_update[key] = obj
+            elif key in to_create:
+                obj = to_create[key]
+            else:
+                parent = parents.get(translation_set_id)
+                if parent is None:
+                    stats['skipped'] += 1
+                    continue
+                obj = parent.prepare_translation(language)
+                to_create[key] = obj
+            update_fields.update(_set_contents(obj, fields))
+        if has_translation_status:
+            for obj in itertools.chain(to_update.values(), to_create.values()):
+                obj.update_translation_status()
+            update_fields.add('translation_status')
+        if to_update and update_fields:
+            bulk_update(to_update.values(), update_fields, using=db)
+        if to_create:
+            model._default_manager.using(db).bulk_create(to_create.values())
+        coverage.record_bulk(model, to_update.values(), previous_coverage_states)
+        coverage.record_bulk(model, to_create.values())
+        pin_translation_sets(model, translation_set_ids)
+        stats['updated'] += len(to_update)
+        stats['created'] += len(to_create)
@@ -0,0 +1,44 @@
+import io
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...interchange import export_translations, export_translations_xliff
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the translatable contents of <app.model> as JSONL (or as "
+        "XLIFF for a single target language).")
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="The model to export, as <app.model>.")
+        parser.add_argument(
+            '-o', '--output', dest='output', default=None,
+            help="File to write to, defaults to stdout.")
+        parser.add_argument(
+            '-l', '--language', dest='languages', action='append', default=None,
+            help="Only export translations into this language. Can be given multiple times.")
+        parser.add_argument(
+            '--xliff', dest='xliff', default=None, metavar='LANGUAGE',
+            help="Write XLIFF with LANGUAGE as target language instead of JSONL.")
+
+    def handle(self, *args, **options):
+        try:
+            Model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        queryset = Model._default_manager.all()
+        if options['output']:
+            stream = io.open(options['output'], 'w', encoding='utf-8')
+        else:
+            stream = self.stdout
+        try:
+            if options['xliff']:
+                count = export_translations_xliff(queryset, stream, options['xliff'])
+            else:
+                count = export_translations(queryset, stream, languages=options['languages'])
+        finally:
+            if options['output']:
+                stream.close()
+        self.stderr.write("Exported {0} translation sets.".format(count))
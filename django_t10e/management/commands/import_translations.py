@@ -0,0 +1,36 @@
+import io
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...interchange import import_translations, read_jsonl, read_xliff
+
+
+class Command(BaseCommand):
+    help = (
+        "Import translated contents of <app.model> from a JSONL or XLIFF "
+        "file as written by the export_translations command.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="The model to import, as <app.model>.")
+        parser.add_argument('file', help="The JSONL or XLIFF (*.xlf, *.xliff) file to import.")
+        parser.add_argument(
+            '--batch-size', dest='batch_size', type=int, default=500,
+            help="Number of translations to write per batch.")
+
+    def handle(self, *args, **options):
+        try:
+            Model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        filename = options['file']
+        if filename.endswith(('.xlf', '.xliff')):
+            with io.open(filename, 'rb') as stream:
+                stats = import_translations(
+                    Model, read_xliff(stream), batch_size=options['batch_size'])
+        else:
+            with io.open(filename, 'r', encoding='utf-8') as stream:
+                stats = import_translations(
+                    Model, read_jsonl(stream), batch_size=options['batch_size'])
+        self.stdout.write(
+            "Created {created}, updated {updated}, skipped {skipped} translations.".format(**stats))
@@ -1,11 +1,15 @@
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import get_language
 from django_cloneable.models import CloneableMixin
 
+from .coverage import tracking as coverage
 from .managers import TranslatableManager
 from .fields import LanguageField
+from .routing import (
+    any_translation_set_pinned, db_for_lookup, db_for_sync, pin_translation_set,
+    using_lookup_db)
 from .updatetranslations import UpdateTranslationsMixin  # noqa
 from .translationstatus import TranslationStatusMixin  # noqa
 
@@ -26,10 +30,23 @@ class TranslatableBaseMixin(CloneableMixin):
     objects = TranslatableManager()
 
     def save(self, *args, **kwargs):
+        if not coverage.is_enabled():
+            return self._save_translation(*args, **kwargs)
+        # Read the previous coverage state under a row lock, so concurrent
+        # saves of the same translation can not make the statistics drift.
+        db = kwargs.get('using') or db_for_sync(self.__class__, instance=self)
+        with transaction.atomic(using=db):
+            previous_coverage_state = coverage.get_previous_state(self, using=db)
+            result = self._save_translation(*args, **kwargs)
+            coverage.record_save(self, previous_coverage_state)
+        return result
+
+    def _save_translation(self, *args, **kwargs):
         result = super(TranslatableBaseMixin, self).save(*args, **kwargs)
         if not self.translation_set_id:
             self.translation_set_id = self.pk
             self.__class__.objects.filter(pk=self.pk).update(translation_set=self.pk)
+        pin_translation_set(self.__class__, self.translation_set_id)
         return result
 
     def translations(self):
@@ -37,9 +54,13 @@ class TranslatableBaseMixin(CloneableMixin):
 
     def prepare_translation(self, language, exclude_fields=None):
         attrs = {
-            'translation_set': self.translation_set,
             'language': language,
         }
+        # Avoid fetching the translation set (from the read database).
+        if self.translation_set_id == self.pk:
+            attrs['translation_set'] = self
+        else:
+            attrs['translation_set_id'] = self.translation_set_id
         # Set contents fields to None.
         for contents_field in self.get_contents_fields():
             attrs[contents_field] = None
@@ -61,7 +82,8 @@ class TranslatableBaseMixin(CloneableMixin):
         limit the creation to a specific languages by providing the languages
         argument.
         """
-        untranslated_languages = set(code for code, name in self.untranslated_languages())
+        db = db_for_sync(self.__class__, instance=self)
+        untranslated_languages = set(code for code, name in self.untranslated_languages(using=db))
         required_languages = set(self.get_required_languages())
         for language in untranslated_languages.intersection(required_languages):
             self.create_translation(language)
@@ -81,7 +103,7 @@ class TranslatableUtilsMixin(object):
             language = get_language()
         if language == self.language:
             return self
-        return self.translations().translate(language).get()
+        return using_lookup_db(self.translations(), instance=self).translate(language).get()
 
     def safe_translate(self, language=None):
         # Cache result for faster access when called multiple times.
@@ -98,9 +120,18 @@ class TranslatableUtilsMixin(object):
                 self._safe_translate_cache[language] = self
         return self._safe_translate_cache[language]
 
-    def untranslated_languages(self):
+    def untranslated_languages(self, using=None):
+        """
+        Return the ``(code, name)`` pairs of all languages without a
+        translation. Reads from ``using`` if given, otherwise from the lookup
+        database (see ``django_t10e.routing.db_for_lookup``).
+        """
         untranslated_languages = []
-        translated_languages = set(self.translations().values_list('language', flat=True))
+        if using is None:
+            translations = using_lookup_db(self.translations(), instance=self)
+        else:
+            translations = self.translations().using(using)
+        translated_languages = set(translations.values_list('language', flat=True))
         for language in LANGUAGES:
             if language[0] not in translated_languages:
                 untranslated_languages.append(language)
@@ -109,7 +140,9 @@ class TranslatableUtilsMixin(object):
     # TODO: Move this somewhere else (template filter?), not generally needed
     def languages(self):
         languages = []
-        translations = dict([(t.language, t) for t in self.translations()])
+        translations = dict([
+            (t.language, t)
+            for t in using_lookup_db(self.translations(), instance=self)])
         for language in LANGUAGES:
             languages.append((language, translations.get(language[0])))
         return languages
@@ -122,6 +155,55 @@ class TranslatableUtilsMixin(object):
         return tuple(getattr(self, '_contents_fields', []))
 
 
+def _get_missing_translations(objects, language):
+    """
+    Fill the ``_safe_translate_cache`` where no query is needed and return
+    the remaining objects grouped by model.
+    """
+    missing = {}
+    for obj in objects:
+        if not hasattr(obj, '_safe_translate_cache'):
+            obj._safe_translate_cache = {}
+        if language in obj._safe_translate_cache:
+            continue
+        if obj.language == language:
+            obj._safe_translate_cache[language] = obj
+            continue
+        missing.setdefault(obj.__class__, []).append(obj)
+    return missing
+
+
+def _get_translations_queryset(model, model_objects, language):
+    translation_set_ids = set(obj.translation_set_id for obj in model_objects)
+    pinned = any_translation_set_pinned(model, translation_set_ids)
+    db = db_for_lookup(model, pinned=pinned)
+    return model._default_manager.using(db).filter(
+        translation_set__in=translation_set_ids, language=language)
+
+
+def _store_translations(model_objects, translations, language):
+    translations = dict(
+        (translation.translation_set_id, translation)
+        for translation in translations)
+    for obj in model_objects:
+        obj._safe_translate_cache[language] = translations.get(obj.translation_set_id, obj)
+
+
+def bulk_safe_translate(objects, language=None):
+    """
+    Like calling ``safe_translate(language)`` on each of ``objects``, but
+    resolves all missing translations with one query per model. Results are
+    stored in (and read from) the ``_safe_translate_cache`` of each object.
+    """
+    if language is None:
+        language = get_language()
+    objects = list(objects)
+    for model, model_objects in _get_missing_translations(objects, language).items():
+        translations = _get_translations_queryset(model, model_objects, language)
+        _store_translations(model_objects, translations, language)
+    return [obj._safe_translate_cache[language] for obj in objects]
+
+
 class TranslatableMixin(TranslatableBaseMixin, TranslatableUtilsMixin):
     class Meta(TranslatableBaseMixin.Meta):
         abstract = True
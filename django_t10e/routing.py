@@ -0,0 +1,93 @@
+"""
+Database routing for translation lookups.
+
+Reads that are part of syncing a translation set (``update_translations()``)
+always go to the write database, so they never see stale siblings. Lookups
+like ``translate()`` go to the read database as chosen by the database
+routers, unless the translation set was modified within the last
+``T10E_READ_YOUR_WRITES_TIMEOUT`` seconds.
+"""
+from django.core.cache import caches
+from django.db import models, router
+
+from . import settings
+
+
+def _get_cache():
+    return caches[settings.T10E_READ_YOUR_WRITES_CACHE]
+
+
+def _get_pin_key(model, translation_set_id):
+    opts = model._meta.concrete_model._meta
+    return 't10e:pinned:{0}.{1}:{2}'.format(
+        opts.app_label, opts.model_name, translation_set_id)
+
+
+def _get_hints(instance):
+    # Delegating objects (see TranslatableUtilsMixin) are no model instances
+    # and cannot be passed as hint to the routers.
+    if isinstance(instance, models.Model):
+        return {'instance': instance}
+    return {}
+
+
+def pin_translation_sets(model, translation_set_ids):
+    """
+    Send lookups of the given translation sets to the write database for the
+    next ``T10E_READ_YOUR_WRITES_TIMEOUT`` seconds.
+    """
+    timeout = settings.T10E_READ_YOUR_WRITES_TIMEOUT
+    if not timeout:
+        return
+    keys = dict(
+        (_get_pin_key(model, translation_set_id), True)
+        for translation_set_id in translation_set_ids
+        if translation_set_id is not None)
+    if keys:
+        _get_cache().set_many(keys, timeout)
+
+
+def pin_translation_set(model, translation_set_id):
+    pin_translation_sets(model, [translation_set_id])
+
+
+def is_translation_set_pinned(model, translation_set_id):
+    if not settings.T10E_READ_YOUR_WRITES_TIMEOUT or translation_set_id is None:
+        return False
+    return bool(_get_cache().get(_get_pin_key(model, translation_set_id)))
+
+
+def any_translation_set_pinned(model, translation_set_ids):
+    if not settings.T10E_READ_YOUR_WRITES_TIMEOUT:
+        return False
+    keys = [
+        _get_pin_key(model, translation_set_id)
+        for translation_set_id in translation_set_ids
+        if translation_set_id is not None]
+    return any(_get_cache().get_many(keys).values())
+
+
+def db_for_sync(model, instance=None):
+    """
+    Database to use for reads while syncing a translation set.
+    """
+    return router.db_for_write(model, **_get_hints(instance))
+
+
+def db_for_lookup(model, instance=None, translation_set_id=None, pinned=None):
+    """
+    Database to use for request-time lookups in a translation set. Pass
+    ``pinned`` if the pinning was already checked, e.g. for many sets at once
+    with ``any_translation_set_pinned()``.
+    """
+    if pinned is None:
+        if translation_set_id is None:
+            translation_set_id = getattr(instance, 'translation_set_id', None)
+        pinned = is_translation_set_pinned(model, translation_set_id)
+    if pinned:
+        return router.db_for_write(model, **_get_hints(instance))
+    return router.db_for_read(model, **_get_hints(instance))
+
+
+def using_lookup_db(queryset, instance=None):
+    return queryset.using(db_for_lookup(queryset.model, instance=instance))
@@ -1,3 +1,17 @@
 from django.conf import settings
 
 T10E_LANGUAGE_CHOICES = getattr(settings, 'T10E_LANGUAGE_CHOICES', settings.LANGUAGES)
+
+# Number of seconds that lookups of a translation set are sent to the write
+# database after it was modified (read-your-writes). ``0`` disables pinning.
+T10E_READ_YOUR_WRITES_TIMEOUT = getattr(settings, 'T10E_READ_YOUR_WRITES_TIMEOUT', 0)
+T10E_READ_YOUR_WRITES_CACHE = getattr(settings, 'T10E_READ_YOUR_WRITES_CACHE', 'default')
+
+# Do not wait for other syncs of the same translation set, but defer the
+# sync (see ``UpdateTranslationsMixin.defer_update_translations``). Ignored
+# (with a logged warning) on databases without ``SELECT ... FOR UPDATE
+# NOWAIT``, e.g. SQLite.
+T10E_SYNC_LOCK_NOWAIT = getattr(settings, 'T10E_SYNC_LOCK_NOWAIT', False)
+# Log a warning if locking a translation set took longer than this many
+# seconds. ``None`` disables the warning.
+T10E_SYNC_LOCK_WAIT_WARNING = getattr(settings, 'T10E_SYNC_LOCK_WAIT_WARNING', None)
@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+
+# Sent by ``UpdateTranslationsMixin.defer_update_translations`` when a sync
+# was skipped because the translation set was locked. Receivers should
+# schedule ``instance.update_translations()`` to run again later.
+translations_sync_deferred = Signal(providing_args=['instance'])
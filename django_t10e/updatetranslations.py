@@ -1,11 +1,42 @@
+import logging
+import time
 from django.db import models
-from django.db import transaction
+from django.db import connections, transaction, DatabaseError
 from django.db.models.fields import FieldDoesNotExist
 from django_cloneable.models import ModelCloneHelper
+from . import settings
+from .coverage import tracking as coverage
 from .fields import UnsyncedI18nFieldsField
+from .routing import db_for_sync, pin_translation_set
+from .signals import translations_sync_deferred
 from .translationstatus import TranslationStatusMixin
 
 
+logger = logging.getLogger('django_t10e.locking')
+
+# Error codes of a failed ``SELECT ... FOR UPDATE NOWAIT``: PostgreSQL's
+# ``lock_not_available``, MySQL's ``ER_LOCK_NOWAIT`` and Oracle's ORA-00054.
+LOCK_NOT_AVAILABLE_PGCODE = '55P03'
+LOCK_NOT_AVAILABLE_CODES = (3572, 54)
+
+
+def is_lock_not_available(error):
+    """
+    Return ``True`` if the ``DatabaseError`` ``error`` was raised because a
+    ``NOWAIT`` lock could not be acquired, not for any other reason (e.g. a
+    lost connection or a statement timeout).
+    """
+    # Django keeps the exception of the database driver as ``__cause__``.
+    cause = getattr(error, '__cause__', None) or error
+    if getattr(cause, 'pgcode', None) == LOCK_NOT_AVAILABLE_PGCODE:
+        return True
+    if not cause.args:
+        return False
+    # MySQLdb passes the error number, cx_Oracle an error object.
+    code = getattr(cause.args[0], 'code', cause.args[0])
+    return code in LOCK_NOT_AVAILABLE_CODES
+
+
 class UpdateTranslationsMixin(TranslationStatusMixin, models.Model):
     """
     Helper to syncronize fields that do not contain translatable content.
@@ -44,18 +75,116 @@ class UpdateTranslationsMixin(TranslationStatusMixin, models.Model):
         """
         return list(self.unsynced_i18n_fields)
 
-    @transaction.atomic
-    def update_translations(self):
+    def update_translations(self, nowait=None):
         """
         Entry point for the feature of this mixin.
+
+        All reads happen on the write database, so replication lag can not
+        make us sync against stale translations. The translation set is
+        locked first (see ``lock_translation_set``), so concurrent syncs of the
+        same set are serialized instead of deadlocking. A translation is only
+        saved if one of its synced fields or its translation status changed.
+
+        With ``nowait`` (defaults to ``T10E_SYNC_LOCK_NOWAIT``) a set that is
+        locked by somebody else is not synced now, ``defer_update_translations``
+        is called instead. Returns ``False`` in that case, ``True`` otherwise.
+        Other database errors are raised as usual. On backends without
+        ``SELECT ... FOR UPDATE NOWAIT`` (e.g. SQLite) ``nowait`` is ignored,
+        the sync waits for the lock and a warning is logged.
+        """
+        if nowait is None:
+            nowait = settings.T10E_SYNC_LOCK_NOWAIT
+        db = db_for_sync(self.__class__, instance=self)
+        with transaction.atomic(using=db):
+            try:
+                # Use a savepoint, so a failed NOWAIT lock does not break the
+                # surrounding transaction.
+                with transaction.atomic(using=db):
+                    self.lock_translation_set(nowait=nowait)
+            except DatabaseError as error:
+                if not nowait or not is_lock_not_available(error):
+                    raise
+                logger.info(
+                    'Deferring sync of %s.%s translation set %s, it is locked.',
+                    self._meta.app_label, self._meta.model_name, self.translation_set_id)
+                self.defer_update_translations()
+                return False
+            with coverage.collect_deltas():
+                self.create_required_translations()
+                for translation in self.translations().using(db).exclude(pk=self.pk).order_by('pk'):
+                    if translation.shall_update_from_translation(self):
+                        translation.update_from_translation(self)
+                    if self._has_translation_status_field():
+                        # Rows whose status is already current (e.g. because
+                        # ``update_from_translation()`` just saved them) are
+                        # not written again.
+                        translation_status = translation.translation_status
+                        translation.update_translation_status()
+                        if translation.translation_status != translation_status:
+                            translation.save()
+        pin_translation_set(self.__class__, self.translation_set_id)
+        return True
+
+    def lock_translation_set(self, nowait=False):
+        """
+        Lock all rows of the translation set with ``SELECT ... FOR UPDATE``,
+        always in primary key order so that concurrent syncs can not deadlock
+        each other. Must be called inside a transaction.
+
+        If you save a translation and sync it in the same transaction, lock the
+        set before saving; otherwise the saved row is already locked out of
+        order.
+
+        The time spent waiting for the lock is stored in
+        ``translation_set_lock_wait`` (in seconds) and logged to the
+        ``django_t10e.locking`` logger.
+
+        ``nowait`` is ignored (and a warning is logged) if the database does
+        not support ``SELECT ... FOR UPDATE NOWAIT``.
+        """
+        db = db_for_sync(self.__class__, instance=self)
+        if nowait and not connections[db].features.has_select_for_update_nowait:
+            logger.warning(
+                'Database %r does not support NOWAIT, waiting for the lock of '
+                '%s.%s translation set %s.',
+                db, self._meta.app_label, self._meta.model_name, self.translation_set_id)
+            nowait = False
+        queryset = (
+            self.__class__._default_manager.using(db)
+            .filter(translation_set=self.translation_set_id)
+            .order_by('pk')
+            .select_for_update(nowait=nowait))
+        start = time.time()
+        try:
+            translations = list(queryset.values_list('pk', flat=True))
+        finally:
+            self.translation_set_lock_wait = time.time() - start
+            threshold = settings.T10E_SYNC_LOCK_WAIT_WARNING
+            if threshold is not None and self.translation_set_lock_wait > threshold:
+                log = logger.warning
+            else:
+                log = logger.debug
+            log(
+                'Waited %.3fs to lock %s.%s translation set %s.',
+                self.translation_set_lock_wait, self._meta.app_label,
+                self._meta.model_name, self.translation_set_id)
+        return translations
+
+    def defer_update_translations(self):
+        """
+        Called instead of syncing if ``update_translations(nowait=True)``
+        found the translation set locked. Sends the
+        ``translations_sync_deferred`` signal, connect to it (or override this
+        method) to run ``update_translations()`` again later, e.g. from a task
+        queue. Otherwise the translation set stays out of sync.
         """
-        self.create_required_translations()
-        for translation in self.translations().exclude(pk=self.pk):
-            if translation.shall_update_from_translation(self):
-                translation.update_from_translation(self)
-            if self._has_translation_status_field():
-                translation.update_translation_status()
-                translation.save()
+        responses = translations_sync_deferred.send(sender=self.__class__, instance=self)
+        if not responses:
+            logger.warning(
+                'Sync of %s.%s translation set %s was skipped, because it is '
+                'locked, and nobody handles translations_sync_deferred. The '
+                'translations are out of sync.',
+                self._meta.app_label, self._meta.model_name, self.translation_set_id)
 
     def shall_update_from_translation(self, translation):
         """
@@ -74,10 +203,11 @@ class UpdateTranslationsMixin(TranslationStatusMixin, models.Model):
         local = getattr(self, field_name)
         new_value = getattr(translation, field_name)
         if field:
+            db = db_for_sync(self.__class__, instance=self)
             is_reverse_relation = (field.one_to_many and field.auto_created)
             if isinstance(field, models.ManyToManyField):
-                local = list(local.values_list('pk', flat=True))
-                new_value = list(new_value.values_list('pk', flat=True))
+                local = list(local.using(db).values_list('pk', flat=True))
+                new_value = list(new_value.using(db).values_list('pk', flat=True))
                 return local != new_value
             elif is_reverse_relation:
                 # Comparing relations can be a bit tricky. What fields should
@@ -102,8 +232,8 @@ class UpdateTranslationsMixin(TranslationStatusMixin, models.Model):
                         not getattr(rel_field, 'primary_key', False) and
                         # Skip many to many fields.
                         not isinstance(rel_field, models.ManyToManyField))]
-                local = list(local.values(*compare_field_names).order_by(*compare_field_names))
-                new_value = list(new_value.values(*compare_field_names).order_by(*compare_field_names))
+                local = list(local.using(db).values(*compare_field_names).order_by(*compare_field_names))
+                new_value = list(new_value.using(db).values(*compare_field_names).order_by(*compare_field_names))
         return local != new_value
 
     def update_from_translation(self, translation):
@@ -134,6 +264,7 @@ class UpdateTranslationsMixin(TranslationStatusMixin, models.Model):
             field = self._meta.get_field(field_name)
         except FieldDoesNotExist:
             field = None
+        db = db_for_sync(self.__class__, instance=self)
         reverse_relations = dict(
             (relation.get_accessor_name(), relation)
             for relation in self._meta.get_all_related_objects())
@@ -142,13 +273,13 @@ class UpdateTranslationsMixin(TranslationStatusMixin, models.Model):
                 rel_name = field.m2m_field_name()
 
                 # Clear the relation ...
-                self_m2m_objs = field.rel.through._default_manager.filter(**{
+                self_m2m_objs = field.rel.through._default_manager.using(db).filter(**{
                     rel_name: self,
                 })
                 self_m2m_objs.delete()
 
                 # Copy it back from the translation ...
-                m2m_objs = field.rel.through._default_manager.filter(**{
+                m2m_objs = field.rel.through._default_manager.using(db).filter(**{
                     rel_name: translation,
                 })
 
@@ -161,12 +292,12 @@ class UpdateTranslationsMixin(TranslationStatusMixin, models.Model):
                         ModelCloneHelper(m2m_obj).clone(attrs={rel_name: self})
             # normal m2m, this is easy
             else:
-                new_value = getattr(translation, field_name).all()
+                new_value = getattr(translation, field_name).using(db)
                 setattr(self, field_name, new_value)
         elif field_name in reverse_relations:
             relation = reverse_relations[field_name]
-            reverse_queryset = getattr(self, field_name).all()
-            reverse_translation_queryset = getattr(translation, field_name).all()
+            reverse_queryset = getattr(self, field_name).using(db)
+            reverse_translation_queryset = getattr(translation, field_name).using(db)
             reverse_queryset.delete()
             for related in reverse_translation_queryset:
                 # Clone related object, but point it to the new translation
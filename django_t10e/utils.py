@@ -0,0 +1,36 @@
+from django.db import connections, router
+from django.db.models import Case, Value, When
+
+
+def bulk_update(objs, fields, batch_size=None, using=None):
+    """
+    Write the given ``fields`` of all ``objs`` back to the database with one
+    ``UPDATE ... SET field = CASE pk WHEN ... END`` statement per batch.
+
+    This is a stand-in for ``QuerySet.bulk_update()`` which is not available
+    in the Django versions we support. Like ``QuerySet.update()`` it does not
+    call ``save()`` and does not send any signals.
+    """
+    objs = list(objs)
+    if not objs:
+        return 0
+    model = objs[0].__class__
+    opts = model._meta
+    fields = [opts.get_field(name) for name in fields]
+    db = using or router.db_for_write(model)
+    # Every object needs two parameters per field (the pk in ``WHEN`` and the
+    # value in ``THEN``) plus one for the ``pk IN (...)`` filter.
+    max_batch_size = connections[db].ops.bulk_batch_size(['pk'] + fields * 2, objs)
+    batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+    updated = 0
+    for start in range(0, len(objs), batch_size):
+        batch = objs[start:start + batch_size]
+        update_kwargs = {}
+        for field in fields:
+            when_statements = [
+                When(pk=obj.pk, then=Value(getattr(obj, field.attname), output_field=field))
+                for obj in batch]
+            update_kwargs[field.attname] = Case(*when_statements, output_field=field)
+        pks = [obj.pk for obj in batch]
+        updated += model._default_manager.using(db).filter(pk__in=pks).update(**update_kwargs)
+    return updated
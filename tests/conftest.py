@@ -0,0 +1,22 @@
+import datetime
+import sys
+
+import pytest
+
+from .models import Article
+
+
+@pytest.fixture
+def article(db):
+    return Article.objects.create(
+        language='en', title='I18N is hard', text='Really.',
+        pub_date=datetime.date(2016, 1, 1))
+
+
+@pytest.fixture
+def article_de(article):
+    return article.create_translation('de')
+
+
+if sys.version_info < (3, 5):
+    collect_ignore = ['test_aio.py']
@@ -0,0 +1,30 @@
+from django.db import models
+from django.utils import six
+
+from django_t10e.fields import TranslatableForeignKey
+from django_t10e.models import TranslatableMixin, UpdateTranslationsMixin
+
+
+class Article(TranslatableMixin, UpdateTranslationsMixin):
+    title = models.CharField(max_length=200, null=True, blank=True)
+    text = models.TextField(null=True, blank=True)
+    pub_date = models.DateField(null=True, blank=True)
+    translation_status = models.CharField(max_length=20, blank=True)
+
+    _contents_fields = ('title', 'text')
+
+    def get_synced_i18n_fields(self):
+        return super(Article, self).get_synced_i18n_fields() + ['pub_date']
+
+    def determine_translation_status(self):
+        return 'done' if self.title else 'todo'
+
+    def _clone_attrs(self, duplicate, attrs, exclude=None):
+        # django-cloneable still uses ``dict.iteritems()``.
+        for attname, value in six.iteritems(attrs or {}):
+            setattr(duplicate, attname, value)
+
+
+class Comment(models.Model):
+    article = TranslatableForeignKey(Article)
+    text = models.TextField()
@@ -9,15 +9,33 @@ DATABASES = {
         'NAME': os.path.join(test_dir, 'db.sqlite'),
         'ENGINE': 'django.db.backends.sqlite3',
     },
+    # Only used to test routing. It is a test mirror of 'default', so queries
+    # against it hit the same database.
+    'replica': {
+        'NAME': os.path.join(test_dir, 'db.sqlite'),
+        'ENGINE': 'django.db.backends.sqlite3',
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
 }
 
 USE_I18N = True
+
+LANGUAGE_CODE = 'en'
+
+LANGUAGES = (
+    ('en', 'English'),
+    ('de', 'German'),
+    ('fr', 'French'),
+)
 USE_L10N = True
 
 INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.staticfiles',
     'django_t10e',
+    'django_t10e.coverage',
     'tests',
 ]
 
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+import pytest
+
+from django_t10e import aio, routing, settings
+
+from .models import Article, Comment
+
+
+class AsyncArticle(aio.AsyncTranslatableUtilsMixin, Article):
+    class Meta:
+        proxy = True
+
+
+def run(coroutine):
+    return asyncio.new_event_loop().run_until_complete(coroutine)
+
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def article():
+    article = AsyncArticle.objects.create(language='en', title='Hello')
+    article.create_translation('de')
+    return article
+
+
+def test_atranslate(article):
+    article_de = run(article.atranslate('de'))
+    assert article_de.language == 'de'
+    assert article_de.translation_set_id == article.pk
+    assert run(article.atranslate('en')) is article
+    with pytest.raises(Article.DoesNotExist):
+        run(article.atranslate('fr'))
+
+
+def test_asafe_translate_shares_cache(article):
+    article_de = run(article.asafe_translate('de'))
+    assert article.safe_translate('de') is article_de
+    assert run(article.asafe_translate('fr')) is article
+    assert article._safe_translate_cache == {'de': article_de, 'fr': article}
+
+
+def test_auntranslated_languages(article):
+    assert run(article.auntranslated_languages()) == [('fr', 'French')]
+
+
+def test_abulk_safe_translate(article):
+    other = AsyncArticle.objects.create(language='en', title='Other')
+    german = AsyncArticle.objects.create(language='de', title='Deutsch')
+    translations = run(aio.abulk_safe_translate([article, other, german], 'de'))
+    assert [obj.language for obj in translations] == ['de', 'en', 'de']
+    assert translations[0].translation_set_id == article.pk
+    assert translations[1] is other
+    assert translations[2] is german
+    assert other._safe_translate_cache['de'] is other
+
+
+def test_arelated_translations(article):
+    comment = Comment.objects.create(article=article, text='Nice')
+    translations = run(aio.arelated_translations(comment, 'article'))
+    assert sorted(obj.language for obj in translations) == ['de', 'en']
+
+
+def test_pinning_is_not_checked_on_event_loop(monkeypatch, article):
+    monkeypatch.setattr(settings, 'T10E_READ_YOUR_WRITES_TIMEOUT', 5)
+    threads = []
+    is_pinned = routing.is_translation_set_pinned
+
+    def is_translation_set_pinned(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return is_pinned(*args, **kwargs)
+
+    monkeypatch.setattr(routing, 'is_translation_set_pinned', is_translation_set_pinned)
+    run(article.atranslate('de'))
+    assert threads
+    assert threading.main_thread() not in threads
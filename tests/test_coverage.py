@@ -0,0 +1,130 @@
+import mock
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test.utils import modify_settings
+
+from django_t10e.coverage import tracking
+from django_t10e.coverage.models import TranslationCoverage, TranslationCoverageManager
+from django_t10e.interchange import import_translations
+
+from .models import Article
+
+
+class ProxyArticle(Article):
+    class Meta:
+        proxy = True
+
+
+def get_coverage():
+    return TranslationCoverage.objects.get_coverage(Article)
+
+
+def test_save_and_delete(article, article_de):
+    coverage = get_coverage()
+    assert coverage['total'] == 1
+    assert coverage['languages']['en'] == {'count': 1, 'missing': 0, 'statuses': {'done': 1}}
+    assert coverage['languages']['de'] == {'count': 1, 'missing': 0, 'statuses': {'todo': 1}}
+    assert coverage['languages']['fr'] == {'count': 0, 'missing': 1, 'statuses': {}}
+
+    article_de.title = 'Titel'
+    article_de.save()
+    assert get_coverage()['languages']['de']['statuses'] == {'done': 1}
+
+    article_de.delete()
+    assert get_coverage()['languages']['de'] == {'count': 0, 'missing': 1, 'statuses': {}}
+
+    article.delete()
+    assert get_coverage()['total'] == 0
+
+
+def test_cascading_delete(article, article_de):
+    Article.objects.filter(pk=article.pk).delete()
+    coverage = get_coverage()
+    assert coverage['total'] == 0
+    assert coverage['languages']['de']['count'] == 0
+
+
+def test_concurrent_saves_do_not_drift(article):
+    first = Article.objects.get(pk=article.pk)
+    second = Article.objects.get(pk=article.pk)
+    first.title = ''
+    first.save()
+    second.title = ''
+    second.save()
+    assert get_coverage()['languages']['en']['statuses'] == {'todo': 1}
+
+
+def test_proxy_models_share_statistics(article):
+    with mock.patch.object(
+            TranslationCoverageManager, 'apply_deltas', autospec=True,
+            side_effect=TranslationCoverageManager.apply_deltas) as apply_deltas:
+        with tracking.collect_deltas():
+            ProxyArticle.objects.get(pk=article.pk).create_translation('de')
+            article.create_translation('fr')
+    assert apply_deltas.call_count == 1
+    assert apply_deltas.call_args[0][1] is Article
+    assert get_coverage()['languages']['de']['statuses'] == {'todo': 1}
+
+
+def test_bulk_import(article, article_de):
+    import_translations(Article, [{'translation_set': article.pk, 'translations': {
+        'de': {'fields': {'title': 'Titel'}},
+        'fr': {'fields': {'title': 'Titre'}},
+    }}])
+    coverage = get_coverage()
+    assert coverage['languages']['de']['statuses'] == {'done': 1}
+    assert coverage['languages']['fr'] == {'count': 1, 'missing': 0, 'statuses': {'done': 1}}
+
+
+def test_update_translations_applies_deltas_once_in_order(article, article_de):
+    article.create_translation('fr')
+    article.title = ''
+    article.save()
+    apply_deltas = TranslationCoverageManager.apply_deltas
+    with mock.patch.object(
+            TranslationCoverageManager, 'apply_deltas', autospec=True,
+            side_effect=apply_deltas) as mocked:
+        with mock.patch.object(Article, 'determine_translation_status', return_value='review'):
+            article.update_translations()
+    assert mocked.call_count == 1
+    deltas = mocked.call_args[0][2]
+    assert dict((key, value) for key, value in deltas.items() if value) == {
+        ('de', 'todo'): -1, ('de', 'review'): 1,
+        ('fr', 'todo'): -1, ('fr', 'review'): 1,
+    }
+    assert get_coverage()['languages']['fr']['statuses'] == {'review': 1}
+
+
+def test_apply_deltas_in_sorted_order(db):
+    TranslationCoverage.objects.apply_deltas(
+        Article, {('fr', 'todo'): 1, ('de', 'done'): 1, ('de', 'a'): 1})
+    rows = TranslationCoverage.objects.order_by('pk').values_list('language', 'translation_status')
+    assert list(rows) == [('de', 'a'), ('de', 'done'), ('fr', 'todo')]
+
+
+def test_rebuild(article, article_de):
+    expected = get_coverage()
+    TranslationCoverage.objects.all().delete()
+    call_command('rebuild_translation_coverage', 'tests.article', batch_size=1)
+    assert get_coverage() == expected
+
+
+def test_disabled(article):
+    with modify_settings(INSTALLED_APPS={'remove': 'django_t10e.coverage'}):
+        assert not tracking.is_enabled()
+        article = Article.objects.get(pk=article.pk)
+        with CaptureQueriesContext(connection) as context:
+            article.save()
+        selects = [query['sql'] for query in context.captured_queries if query['sql'].startswith('SELECT')]
+        assert selects == []
+    assert tracking.is_enabled()
+
+
+@pytest.mark.django_db
+def test_is_enabled_is_cached():
+    assert tracking.is_enabled()
+    with mock.patch.object(tracking.apps, 'is_installed') as is_installed:
+        assert tracking.is_enabled()
+    assert not is_installed.called
@@ -0,0 +1,84 @@
+import mock
+import floppyforms.__future__ as forms
+
+from django_t10e.forms import TranslationSetFormGroup
+
+from .models import Article
+
+
+class ArticleForm(forms.ModelForm):
+    class Meta:
+        model = Article
+        fields = ('title', 'text', 'pub_date')
+
+
+def get_data(**values):
+    data = {}
+    for language in ('en', 'de', 'fr'):
+        data['{0}-title'.format(language)] = ''
+        data['{0}-text'.format(language)] = ''
+        data['{0}-pub_date'.format(language)] = ''
+    data.update(values)
+    return data
+
+
+def test_loads_translation_set_with_one_query(article, article_de, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        forms = TranslationSetFormGroup(ArticleForm, article)
+    assert [form.instance.language for form in forms] == ['en', 'de']
+    assert forms['en'].instance is article
+
+
+def test_save(article, article_de):
+    data = get_data(**{
+        'en-title': 'New title', 'en-pub_date': '2017-02-03',
+        'de-title': 'Neuer Titel', 'de-pub_date': '2000-01-01',
+    })
+    forms = TranslationSetFormGroup(ArticleForm, article, data=data)
+    assert forms.is_valid()
+    with mock.patch.object(
+            Article, 'update_translations', autospec=True,
+            side_effect=Article.update_translations) as update_translations:
+        forms.save()
+    assert update_translations.call_count == 1
+
+    article = Article.objects.get(pk=article.pk)
+    article_de = Article.objects.get(pk=article_de.pk)
+    assert article.title == 'New title'
+    assert article_de.title == 'Neuer Titel'
+    assert article_de.translation_status == 'done'
+    # Synced from the source translation.
+    assert article_de.pub_date == article.pub_date
+    assert str(article_de.pub_date) == '2017-02-03'
+
+
+def test_source_form_is_always_included(article, article_de):
+    forms = TranslationSetFormGroup(ArticleForm, article_de, languages=['en'])
+    assert [form.instance.language for form in forms] == ['de', 'en']
+    assert forms.source_form.instance is article_de
+
+
+def test_save_writes_only_changed_fields_of_each_translation(article, article_de):
+    article_fr = article.create_translation('fr')
+    Article.objects.filter(pk=article_fr.pk).update(title='Titre', translation_status='done')
+    data = get_data(**{
+        'en-title': 'I18N is hard', 'en-text': 'Really.', 'en-pub_date': '2016-01-01',
+        'de-title': 'Neuer Titel', 'de-pub_date': '2016-01-01',
+        'fr-title': 'Titre', 'fr-text': 'Vraiment.', 'fr-pub_date': '2016-01-01',
+    })
+    forms = TranslationSetFormGroup(ArticleForm, article, languages=['de', 'fr'], data=data)
+    assert forms.is_valid()
+    # Edited concurrently, after the forms were loaded.
+    Article.objects.filter(pk=article_de.pk).update(text='Wirklich.')
+    Article.objects.filter(pk=article_fr.pk).update(title='Nouveau titre')
+    with mock.patch.object(Article, 'save', autospec=True, side_effect=Article.save) as save:
+        forms.save()
+    # Only the source translation is saved, the bulk written translations
+    # are already up to date and are not saved again.
+    assert [call[0][0].language for call in save.call_args_list] == ['en']
+
+    article_de = Article.objects.get(pk=article_de.pk)
+    article_fr = Article.objects.get(pk=article_fr.pk)
+    assert (article_de.title, article_de.text) == ('Neuer Titel', 'Wirklich.')
+    assert (article_fr.title, article_fr.text) == ('Nouveau titre', 'Vraiment.')
+    assert article_de.translation_status == 'done'
@@ -0,0 +1,100 @@
+import io
+import json
+
+import pytest
+
+from django_t10e.interchange import (
+    export_translations, export_translations_xliff, import_translations,
+    iter_translation_sets, read_jsonl, read_xliff)
+
+from .models import Article
+
+
+def test_iter_translation_sets(article, article_de):
+    article.create_translation('fr')
+    records = list(iter_translation_sets(Article.objects.all(), languages=['de']))
+    assert records == [{
+        'model': 'tests.article',
+        'translation_set': article.pk,
+        'language': 'en',
+        'fields': {'title': 'I18N is hard', 'text': 'Really.'},
+        'translations': {
+            'de': {'pk': article_de.pk, 'fields': {'title': None, 'text': None}},
+        },
+    }]
+
+
+@pytest.mark.django_db
+def test_iter_translation_sets_pages_through_sets():
+    articles = [Article.objects.create(language='en', title=str(i)) for i in range(5)]
+    records = list(iter_translation_sets(Article.objects.all(), chunk_size=2))
+    assert [record['translation_set'] for record in records] == [
+        article.pk for article in articles]
+
+
+def test_export_and_import_jsonl(article, article_de):
+    stream = io.StringIO()
+    assert export_translations(Article.objects.all(), stream) == 1
+    record = json.loads(stream.getvalue())
+    record['translations']['de']['fields']['title'] = 'I18N ist schwer'
+    record['translations']['fr'] = {'fields': {'title': "L'I18N est dure"}}
+
+    stats = import_translations(Article, read_jsonl([json.dumps(record)]))
+
+    assert stats == {'created': 1, 'updated': 1, 'skipped': 0}
+    article_de = Article.objects.get(pk=article_de.pk)
+    assert article_de.title == 'I18N ist schwer'
+    assert article_de.translation_status == 'done'
+    article_fr = article.translations().get(language='fr')
+    assert article_fr.title == "L'I18N est dure"
+    assert article_fr.text is None
+    assert article_fr.pub_date == article.pub_date
+    assert article_fr.translation_status == 'done'
+
+
+def test_import_skips_unknown_languages_and_sets(article):
+    records = [
+        {'translation_set': article.pk, 'translations': {'de-DE': {'fields': {'title': 'x'}}}},
+        {'translation_set': article.pk + 100, 'translations': {'de': {'fields': {'title': 'x'}}}},
+    ]
+    stats = import_translations(Article, records)
+    assert stats == {'created': 0, 'updated': 0, 'skipped': 2}
+    assert article.translations().count() == 1
+
+
+def test_import_ignores_non_contents_fields(article, article_de):
+    records = [{'translation_set': article.pk, 'translations': {
+        'de': {'fields': {'title': 'Titel', 'pub_date': '2000-01-01'}},
+    }}]
+    import_translations(Article, records)
+    article_de = Article.objects.get(pk=article_de.pk)
+    assert article_de.title == 'Titel'
+    assert article_de.pub_date == article.pub_date
+
+
+def test_import_in_batches(db):
+    articles = [Article.objects.create(language='en', title=str(i)) for i in range(5)]
+    records = [
+        {'translation_set': article.pk, 'translations': {'de': {'fields': {'title': 'de'}}}}
+        for article in articles]
+    stats = import_translations(Article, records, batch_size=2)
+    assert stats['created'] == 5
+    assert Article.objects.filter(language='de', title='de').count() == 5
+
+
+def test_export_and_import_xliff(article, article_de):
+    german = Article.objects.create(language='de', title='Nur deutsch')
+    stream = io.StringIO()
+    assert export_translations_xliff(Article.objects.all(), stream, 'fr') == 2
+    xliff = stream.getvalue()
+    assert 'source-language="de" target-language="fr"' in xliff
+    assert 'source-language="en" target-language="fr"' in xliff
+
+    xliff = xliff.replace(
+        '<source>I18N is hard</source>',
+        "<source>I18N is hard</source><target>L'I18N &amp; co</target>")
+    stats = import_translations(Article, read_xliff(io.BytesIO(xliff.encode('utf-8'))))
+
+    assert stats == {'created': 1, 'updated': 0, 'skipped': 0}
+    assert article.translations().get(language='fr').title == "L'I18N & co"
+    assert german.translations().count() == 1
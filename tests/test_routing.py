@@ -0,0 +1,105 @@
+import datetime
+
+import mock
+import pytest
+from django.core.cache import cache
+from django.db import connections
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from django_t10e import routing, settings
+from django_t10e.models import _get_translations_queryset, bulk_safe_translate
+
+from .models import Article, Comment
+
+
+class ReplicaRouter(object):
+    def db_for_read(self, model, **hints):
+        return 'replica'
+
+
+replica_router = override_settings(DATABASE_ROUTERS=['tests.test_routing.ReplicaRouter'])
+
+
+@pytest.fixture
+def read_your_writes(monkeypatch):
+    monkeypatch.setattr(settings, 'T10E_READ_YOUR_WRITES_TIMEOUT', 5)
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_no_pinning_by_default(article):
+    assert not routing.is_translation_set_pinned(Article, article.pk)
+
+
+def test_save_pins_translation_set(read_your_writes, article):
+    assert routing.is_translation_set_pinned(Article, article.pk)
+    assert not routing.is_translation_set_pinned(Article, article.pk + 1)
+    assert routing.any_translation_set_pinned(Article, [article.pk + 1, article.pk])
+
+
+@replica_router
+def test_lookups_use_read_database(article, article_de):
+    queryset = routing.using_lookup_db(article_de.translations(), instance=article_de)
+    assert queryset.db == 'replica'
+    comment = Comment(article=article_de)
+    assert comment.article_translations.all().db == 'replica'
+
+
+@replica_router
+def test_pinned_lookups_use_write_database(read_your_writes, article, article_de):
+    queryset = routing.using_lookup_db(article_de.translations(), instance=article_de)
+    assert queryset.db == 'default'
+    comment = Comment(article=article_de)
+    assert comment.article_translations.all().db == 'default'
+
+
+@replica_router
+def test_update_translations_reads_from_write_database(article, article_de):
+    article.pub_date = datetime.date(2017, 1, 1)
+    article.save()
+    with CaptureQueriesContext(connections['replica']) as replica_queries:
+        with CaptureQueriesContext(connections['default']) as default_queries:
+            article.update_translations()
+    assert len(replica_queries) == 0
+    assert len(default_queries) > 0
+    assert Article.objects.using('default').get(pk=article_de.pk).pub_date == article.pub_date
+
+
+@replica_router
+def test_create_required_translations_reads_from_write_database(article):
+    with mock.patch.object(Article, 'get_required_languages', return_value=['de']):
+        with CaptureQueriesContext(connections['replica']) as replica_queries:
+            article.create_required_translations()
+    assert len(replica_queries) == 0
+    assert article.translations().using('default').filter(language='de').exists()
+
+
+@replica_router
+def test_create_required_translations_uses_untranslated_languages(article):
+    with mock.patch.object(Article, 'get_required_languages', return_value=['de', 'fr']), \
+            mock.patch.object(Article, 'untranslated_languages', return_value=[('fr', 'French')]) as untranslated:
+        article.create_required_translations()
+    untranslated.assert_called_once_with(using='default')
+    languages = article.translations().using('default').order_by('pk').values_list('language', flat=True)
+    assert list(languages) == ['en', 'fr']
+
+
+def test_bulk_safe_translate(article, article_de):
+    other = Article.objects.create(language='en', title='Other')
+    german = Article.objects.create(language='de', title='Deutsch')
+    translations = bulk_safe_translate([article, other, german], 'de')
+    assert translations == [article_de, other, german]
+    assert translations[1] is other
+    assert translations[2] is german
+    assert article._safe_translate_cache == {'de': article_de}
+
+
+@replica_router
+def test_bulk_lookup_uses_write_database_if_any_set_is_pinned(read_your_writes, article):
+    other = Article.objects.create(language='en', title='Other')
+    cache.clear()
+    routing.pin_translation_set(Article, other.pk)
+    assert _get_translations_queryset(Article, [article, other], 'de').db == 'default'
+    cache.clear()
+    assert _get_translations_queryset(Article, [article, other], 'de').db == 'replica'
@@ -0,0 +1,128 @@
+import datetime
+import logging
+
+import mock
+import pytest
+from django.db import DatabaseError, OperationalError, connection
+from django.test.utils import CaptureQueriesContext
+
+from django_t10e import settings
+from django_t10e.forms import TranslationSetFormGroup
+from django_t10e.signals import translations_sync_deferred
+from django_t10e.updatetranslations import is_lock_not_available
+
+from .models import Article
+from .test_forms import ArticleForm, get_data
+
+
+def test_update_translations(article, article_de):
+    article.pub_date = datetime.date(2017, 1, 1)
+    article.save()
+    assert article.update_translations() is True
+    assert Article.objects.get(pk=article_de.pk).pub_date == article.pub_date
+
+
+def test_lock_translation_set_in_pk_order(article, article_de, caplog):
+    article_fr = article.create_translation('fr')
+    with caplog.at_level(logging.DEBUG, logger='django_t10e.locking'):
+        with CaptureQueriesContext(connection) as context:
+            assert article_fr.lock_translation_set() == [article.pk, article_de.pk, article_fr.pk]
+    assert 'ORDER BY "tests_article"."id" ASC' in context.captured_queries[0]['sql']
+    assert article_fr.translation_set_lock_wait >= 0
+    assert 'to lock tests.article translation set' in caplog.text
+
+
+def test_lock_wait_warning(monkeypatch, article, caplog):
+    monkeypatch.setattr(settings, 'T10E_SYNC_LOCK_WAIT_WARNING', -1)
+    with caplog.at_level(logging.WARNING, logger='django_t10e.locking'):
+        article.lock_translation_set()
+    assert [record.levelname for record in caplog.records] == ['WARNING']
+
+
+class LockNotAvailable(Exception):
+    pgcode = '55P03'
+
+
+def lock_not_available():
+    # As raised by Django for psycopg2's LockNotAvailable.
+    error = OperationalError('could not obtain lock on row in relation "tests_article"')
+    error.__cause__ = LockNotAvailable(error.args[0])
+    return error
+
+
+@pytest.fixture
+def locked():
+    with mock.patch.object(Article, 'lock_translation_set', side_effect=lock_not_available()):
+        yield
+
+
+@pytest.mark.parametrize('code', [3572, mock.Mock(code=54)])
+def test_is_lock_not_available(code):
+    error = OperationalError()
+    error.__cause__ = Exception(code, 'Lock not available')
+    assert is_lock_not_available(error)
+    assert is_lock_not_available(lock_not_available())
+    assert not is_lock_not_available(OperationalError('server closed the connection unexpectedly'))
+
+
+def test_nowait_defers_sync(locked, article, article_de):
+    article.pub_date = datetime.date(2017, 1, 1)
+    article.save()
+    receiver = mock.Mock()
+    translations_sync_deferred.connect(receiver)
+    try:
+        assert article.update_translations(nowait=True) is False
+    finally:
+        translations_sync_deferred.disconnect(receiver)
+    assert Article.objects.get(pk=article_de.pk).pub_date == datetime.date(2016, 1, 1)
+    receiver.assert_called_once_with(
+        signal=translations_sync_deferred, sender=Article, instance=article)
+
+
+def test_nowait_without_receiver_warns(locked, article, caplog):
+    with caplog.at_level(logging.WARNING, logger='django_t10e.locking'):
+        assert article.update_translations(nowait=True) is False
+    assert 'out of sync' in caplog.text
+
+
+def test_nowait_setting(monkeypatch, locked, article):
+    monkeypatch.setattr(settings, 'T10E_SYNC_LOCK_NOWAIT', True)
+    assert article.update_translations() is False
+
+
+def test_lock_error_is_raised_without_nowait(locked, article):
+    with pytest.raises(DatabaseError):
+        article.update_translations()
+
+
+def test_nowait_raises_other_errors(article):
+    error = OperationalError('server closed the connection unexpectedly')
+    with mock.patch.object(Article, 'lock_translation_set', side_effect=error):
+        with pytest.raises(OperationalError):
+            article.update_translations(nowait=True)
+
+
+def test_nowait_without_backend_support_warns(article, caplog):
+    assert not connection.features.has_select_for_update_nowait
+    with caplog.at_level(logging.WARNING, logger='django_t10e.locking'):
+        assert article.update_translations(nowait=True) is True
+    assert 'does not support NOWAIT' in caplog.text
+
+
+def test_form_group_locks_before_saving(article, article_de):
+    calls = []
+    lock = Article.lock_translation_set
+    save = Article.save
+
+    def record(name, method):
+        def wrapper(self, *args, **kwargs):
+            calls.append((name, self.language))
+            return method(self, *args, **kwargs)
+        return wrapper
+
+    forms = TranslationSetFormGroup(ArticleForm, article, data=get_data(**{'en-title': 'New'}))
+    assert forms.is_valid()
+    with mock.patch.object(Article, 'lock_translation_set', record('lock', lock)):
+        with mock.patch.object(Article, 'save', record('save', save)):
+            forms.save()
+    assert calls[:2] == [('lock', 'en'), ('save', 'en')]
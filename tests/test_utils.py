@@ -0,0 +1,34 @@
+import mock
+import pytest
+from django.db.backends.utils import CursorWrapper
+
+from django_t10e.utils import bulk_update
+
+from .models import Article
+
+
+@pytest.mark.django_db
+def test_bulk_update():
+    articles = [Article.objects.create(language='en', title='a') for i in range(3)]
+    for i, article in enumerate(articles):
+        article.title = 'title {0}'.format(i)
+    assert bulk_update(articles, ['title']) == 3
+    assert list(Article.objects.order_by('pk').values_list('title', flat=True)) == [
+        'title 0', 'title 1', 'title 2']
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('fields', [['title'], ['title', 'text']])
+def test_bulk_update_respects_sqlite_variable_limit(fields):
+    Article.objects.bulk_create([Article(language='en', title='a') for i in range(1000)])
+    articles = list(Article.objects.all())
+    for article in articles:
+        article.title = 'b'
+        article.text = 'c'
+    execute = CursorWrapper.execute
+    with mock.patch.object(CursorWrapper, 'execute', autospec=True, side_effect=execute) as mocked:
+        assert bulk_update(articles, fields) == 1000
+    # SQLite allows 999 variables per statement.
+    assert max(len(call[0][2]) for call in mocked.call_args_list) <= 999
+    for field in fields:
+        assert Article.objects.filter(**{field: getattr(articles[0], field)}).count() == 1000